@@ -3,6 +3,7 @@ Implementation of functions in the Numpy package.
 """
 
 
+import functools
 import math
 import sys
 import itertools
@@ -86,6 +87,12 @@ class _ScalarHelper(object):
     def store_data(self, indices, val):
         self.builder.store(val, self._ptr)
 
+    def load_flat(self, index):
+        return self.val
+
+    def store_flat(self, index, val):
+        self.builder.store(val, self._ptr)
+
     @property
     def return_val(self):
         return self.builder.load(self._ptr)
@@ -158,6 +165,24 @@ class _ArrayHelper(namedtuple('_ArrayHelper', ('context', 'builder',
         assert ctx.get_data_type(self.base_type) == store_value.type
         bld.store(store_value, self._load_effective_address(indices))
 
+    def load_flat(self, index):
+        """Load the item at *index* of a C contiguous array, taken as a
+        flat buffer.
+        """
+        model = self.context.data_model_manager[self.base_type]
+        ptr = cgutils.gep_inbounds(self.builder, self.data, index)
+        return model.load_from_data_pointer(self.builder, ptr)
+
+    def store_flat(self, index, value):
+        """Store *value* at *index* of a C contiguous array, taken as a
+        flat buffer.
+        """
+        ctx = self.context
+        bld = self.builder
+        store_value = ctx.get_value_as_data(bld, self.base_type, value)
+        assert ctx.get_data_type(self.base_type) == store_value.type
+        bld.store(store_value, cgutils.gep_inbounds(bld, self.data, index))
+
 
 class _ArrayGUHelper(namedtuple('_ArrayHelper', ('context', 'builder',
                                                  'shape', 'strides', 'data',
@@ -544,15 +569,49 @@ def numpy_ufunc_kernel(context, builder, sig, args, ufunc, kernel_class):
     else:
         order = 'C'
 
-    with cgutils.loop_nest(builder, loopshape, intp=intpty, order=order) as loop_indices:
-        vals_in = []
-        for i, (index, arg) in enumerate(zip(indices, inputs)):
-            index.update_indices(loop_indices, i)
-            vals_in.append(arg.load_data(index.as_values()))
-
-        vals_out = _unpack_output_values(ufunc, builder, kernel.generate(*vals_in))
-        for val_out, output in zip(vals_out, outputs):
-            output.store_data(loop_indices, val_out)
+    def strided_loop():
+        with cgutils.loop_nest(builder, loopshape, intp=intpty, order=order) as loop_indices:
+            vals_in = []
+            for i, (index, arg) in enumerate(zip(indices, inputs)):
+                index.update_indices(loop_indices, i)
+                vals_in.append(arg.load_data(index.as_values()))
+
+            vals_out = _unpack_output_values(ufunc, builder, kernel.generate(*vals_in))
+            for val_out, output in zip(vals_out, outputs):
+                output.store_data(loop_indices, val_out)
+
+    def unit_strided_loop():
+        size = functools.reduce(builder.mul, loopshape)
+        with cgutils.for_range(builder, size, intp=intpty) as loop:
+            vals_in = [arg.load_flat(loop.index) for arg in inputs]
+            vals_out = _unpack_output_values(ufunc, builder, kernel.generate(*vals_in))
+            for val_out, output in zip(vals_out, outputs):
+                output.store_flat(loop.index, val_out)
+
+    # When all the arrays are C contiguous and nothing is broadcast, every
+    # array can be walked as a flat buffer with a unit stride. This spares
+    # the per-element index bookkeeping of the general loop, so that LLVM
+    # is able to vectorize the kernel. Broadcasting can only be ruled out
+    # at runtime, hence the two versions of the loop.
+    arrays = [arg for arg in arguments if isinstance(arg, _ArrayHelper)]
+    can_flatten = len(loopshape) > 0 and len(arrays) > 0 and all(
+        ary.layout == 'C' and ary.ndim == len(loopshape) for ary in arrays)
+
+    if can_flatten:
+        unit_strided = cgutils.true_bit
+        for ary in arrays:
+            for dim, loopdim in zip(ary.shape, loopshape):
+                same_dim = builder.icmp_signed('==', dim, loopdim)
+                unit_strided = builder.and_(unit_strided, same_dim)
+
+        with builder.if_else(unit_strided, likely=True) as (is_unit_strided,
+                                                            is_strided):
+            with is_unit_strided:
+                unit_strided_loop()
+            with is_strided:
+                strided_loop()
+    else:
+        strided_loop()
 
     out = _pack_output_values(ufunc, context, builder, sig.return_type, [o.return_val for o in outputs])
     return impl_ret_new_ref(context, builder, sig.return_type, out)
@@ -667,16 +726,21 @@ class _Kernel(object):
         cast_args = [self.cast(val, inty, outty)
                      for val, inty, outty in
                      zip(args, osig.args, isig.args)]
+        module = self.builder.block.function.module
         if self.cres.objectmode:
             func_type = self.context.call_conv.get_function_type(
                 types.pyobject, [types.pyobject] * len(isig.args))
+            entry_point = cgutils.get_or_insert_function(
+                module, func_type,
+                self.cres.fndesc.llvm_func_name)
         else:
-            func_type = self.context.call_conv.get_function_type(
-                isig.return_type, isig.args)
-        module = self.builder.block.function.module
-        entry_point = cgutils.get_or_insert_function(
-            module, func_type,
-            self.cres.fndesc.llvm_func_name)
+            # Declare the entry point the way it is defined, so that the
+            # argument attributes (e.g. noalias on the return and exception
+            # pointers) are visible to the optimizer at the call site.
+            entry_point = self.context.declare_function(module,
+                                                        self.cres.fndesc)
+            # Errors are reported through the status code, never unwound
+            entry_point.attributes.add("nounwind")
         entry_point.attributes.add("alwaysinline")
 
         _, res = self.context.call_conv.call_function(
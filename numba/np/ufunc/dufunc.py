@@ -6,6 +6,7 @@ import numpy as np
 
 from numba import jit, typeof
 from numba.core import cgutils, types, serialize, sigutils, errors
+from numba.core.imputils import impl_ret_borrowed
 from numba.core.extending import (is_jitted, overload_attribute,
                                   overload_method, register_jitable,
                                   intrinsic)
@@ -18,8 +19,8 @@ from numba.parfors import array_analysis
 from numba.np.ufunc import ufuncbuilder
 from numba.np import numpy_support
 from typing import Callable
-from llvmlite import ir
 from numba.core.compiler_lock import global_compiler_lock
+from numba.core.caching import NullCache
 
 
 class UfuncAtIterator:
@@ -131,6 +132,203 @@ class UfuncAtIterator:
         self._store_val(context, builder, a, a_ty, ptr, res)
 
 
+def _remove_at(builder, values, pos):
+    """
+    Return values[:pos] + values[pos + 1:] for the list of LLVM *values*
+    and the runtime position *pos*. Each item is picked with a select,
+    so that no stack round trip is needed.
+    """
+    out = []
+    for i in range(len(values) - 1):
+        shift = builder.icmp_signed('>=', pos.type(i), pos)
+        out.append(builder.select(shift, values[i + 1], values[i]))
+    return out
+
+
+@intrinsic
+def _tuple_slice(typingctx, tup, pos):
+    # Same as
+    # tup = tup[0 : pos] + tup[pos + 1:]
+    retty = types.BaseTuple.from_types([tup.dtype] * (len(tup) - 1))
+    sig = retty(tup, pos)
+
+    def codegen(context, builder, sig, args):
+        tupty, posty = sig.args
+        values = cgutils.unpack_tuple(builder, args[0], len(tupty))
+        pos = context.cast(builder, args[1], posty, types.intp)
+        return context.make_tuple(builder, sig.return_type,
+                                  _remove_at(builder, values, pos))
+
+    return sig, codegen
+
+
+@intrinsic
+def _move_axis_last(typingctx, array, axis):
+    # Same as
+    # np.transpose(array, axes[:axis] + axes[axis + 1:] + (axis,))
+    # without the validation of the permutation, as "axis" was already
+    # checked by the caller.
+    retty = array.copy(layout='A')
+    sig = retty(array, axis)
+
+    def codegen(context, builder, sig, args):
+        from numba.np.arrayobj import make_array, populate_array
+
+        aryty, axisty = sig.args
+        ary = make_array(aryty)(context, builder, args[0])
+        axis = context.cast(builder, args[1], axisty, types.intp)
+
+        def move(values):
+            stack = cgutils.alloca_once_value(
+                builder, cgutils.pack_array(builder, values))
+            last = builder.load(cgutils.gep_inbounds(builder, stack, 0, axis))
+            return _remove_at(builder, values, axis) + [last]
+
+        shape = cgutils.unpack_tuple(builder, ary.shape)
+        strides = cgutils.unpack_tuple(builder, ary.strides)
+        ret = make_array(retty)(context, builder)
+        populate_array(ret,
+                       data=ary.data,
+                       shape=move(shape),
+                       strides=move(strides),
+                       itemsize=ary.itemsize,
+                       meminfo=ary.meminfo,
+                       parent=ary.parent)
+        return impl_ret_borrowed(context, builder, retty, ret._getvalue())
+
+    return sig, codegen
+
+
+@intrinsic
+def _fold_c(typingctx, array, axis):
+    # Same as
+    # array.reshape((prod(array.shape[:axis]), prod(array.shape[axis:])))
+    # for a C-contiguous "array", without the checks of reshape(). "axis"
+    # may be anything from 0 to array.ndim included.
+    assert array.layout == 'C'
+    retty = array.copy(ndim=2)
+    sig = retty(array, axis)
+
+    def codegen(context, builder, sig, args):
+        from numba.np.arrayobj import make_array, populate_array
+
+        aryty, axisty = sig.args
+        ary = make_array(aryty)(context, builder, args[0])
+        axis = context.cast(builder, args[1], axisty, types.intp)
+
+        one = context.get_constant(types.intp, 1)
+        lead = trail = one
+        for dim, size in enumerate(cgutils.unpack_tuple(builder, ary.shape)):
+            dim = context.get_constant(types.intp, dim)
+            is_lead = builder.icmp_signed('<', dim, axis)
+            lead = builder.mul(lead, builder.select(is_lead, size, one))
+            trail = builder.mul(trail, builder.select(is_lead, one, size))
+
+        ret = make_array(retty)(context, builder)
+        populate_array(ret,
+                       data=ary.data,
+                       shape=[lead, trail],
+                       strides=[builder.mul(trail, ary.itemsize),
+                                ary.itemsize],
+                       itemsize=ary.itemsize,
+                       meminfo=ary.meminfo,
+                       parent=ary.parent)
+        return impl_ret_borrowed(context, builder, retty, ret._getvalue())
+
+    return sig, codegen
+
+
+@intrinsic
+def _move_axes_last(typingctx, array, axes):
+    # Same as
+    # np.transpose(array, kept + tuple(sorted(axes)))
+    # where "kept" are the other axes in order, without the validation of
+    # the permutation, as "axes" was already checked by the caller.
+    retty = array.copy(layout='A')
+    sig = retty(array, axes)
+
+    def codegen(context, builder, sig, args):
+        from numba.np.arrayobj import make_array, populate_array
+
+        aryty, axesty = sig.args
+        ary = make_array(aryty)(context, builder, args[0])
+        axes = [context.cast(builder, ax, axesty.dtype, types.intp)
+                for ax in cgutils.unpack_tuple(builder, args[1], len(axesty))]
+
+        # Work out where each dimension goes. The kept ones come first and
+        # the reduced ones after them, both in increasing order.
+        zero = context.get_constant(types.intp, 0)
+        one = context.get_constant(types.intp, 1)
+        kept = zero
+        moved = context.get_constant(types.intp, aryty.ndim - len(axes))
+        positions = []
+        for dim in range(aryty.ndim):
+            dim = context.get_constant(types.intp, dim)
+            is_moved = cgutils.false_bit
+            for ax in axes:
+                is_moved = builder.or_(is_moved,
+                                       builder.icmp_signed('==', ax, dim))
+            positions.append(builder.select(is_moved, moved, kept))
+            kept = builder.add(kept, builder.select(is_moved, zero, one))
+            moved = builder.add(moved, builder.select(is_moved, one, zero))
+
+        def move(values):
+            stack = cgutils.alloca_once(builder, values[0].type,
+                                        size=len(values))
+            for pos, val in zip(positions, values):
+                builder.store(val, builder.gep(stack, [pos], inbounds=True))
+            return [builder.load(cgutils.gep_inbounds(builder, stack, i))
+                    for i in range(len(values))]
+
+        shape = cgutils.unpack_tuple(builder, ary.shape)
+        strides = cgutils.unpack_tuple(builder, ary.strides)
+        ret = make_array(retty)(context, builder)
+        populate_array(ret,
+                       data=ary.data,
+                       shape=move(shape),
+                       strides=move(strides),
+                       itemsize=ary.itemsize,
+                       meminfo=ary.meminfo,
+                       parent=ary.parent)
+        return impl_ret_borrowed(context, builder, retty, ret._getvalue())
+
+    return sig, codegen
+
+
+@intrinsic
+def _fixup_axis(typingctx, axis, ndim):
+    # Same as
+    # tuple(ax + ndim if ax < 0 else ax for ax in axis)
+    # with the items picked by selects instead of branches.
+    sig = axis(axis, ndim)
+
+    def codegen(context, builder, sig, args):
+        axisty, ndimty = sig.args
+        values = cgutils.unpack_tuple(builder, args[0], len(axisty))
+        if axisty.dtype.signed:
+            ndim = context.cast(builder, args[1], ndimty, axisty.dtype)
+            zero = context.get_constant(axisty.dtype, 0)
+            values = [builder.select(builder.icmp_signed('<', ax, zero),
+                                     builder.add(ax, ndim), ax)
+                      for ax in values]
+        return context.make_tuple(builder, axisty, values)
+
+    return sig, codegen
+
+
+@register_jitable
+def _reduce_seed(items, first, identity, initial):
+    # Start value of a reduction of "items": "initial" if given, otherwise
+    # the identity of the ufunc if it has one, otherwise items[first].
+    # Nested "is None" tests, so that dead branches are pruned and the
+    # other values are never typed or read.
+    if initial is None:
+        if identity is None:
+            return items[first]
+        return identity
+    return initial
+
+
 def make_dufunc_kernel(_dufunc):
     from numba.np import npyimpl
 
@@ -146,6 +344,10 @@ def make_dufunc_kernel(_dufunc):
             super().__init__(context, builder, outer_sig)
             self.inner_sig, self.cres = self.dufunc.find_ewise_function(
                 outer_sig.args)
+            # Object mode loops are rejected when typing, see _type_me()
+            assert not self.cres.objectmode
+            # Only link the loop being called, not every loop of the DUFunc
+            context.add_linking_libs((self.cres.library,))
 
     DUFuncKernel.__name__ += _dufunc.ufunc.__name__
     return DUFuncKernel
@@ -192,7 +394,23 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
         self.__name__ = dispatcher.py_func.__name__
         self.__doc__ = dispatcher.py_func.__doc__
         self._lower_me = DUFuncLowerer(self)
-        self._install_cg()
+        # Maps the argument types of each compiled loop to its compile
+        # result, to find the loop for given types in constant time
+        self._compiled_argtys = {cres.signature.args: cres
+                                 for cres in dispatcher.overloads.values()}
+        # Numba types of the items of NumPy array and scalar arguments,
+        # by dtype, see _dtype_argty()
+        self._dtype_argtys = {}
+        # Loops picked for types without an exact match once frozen, see
+        # find_ewise_function()
+        self._frozen_loops = {}
+        # Call-site signatures computed by _type_me(), keyed on the
+        # argument types and on whether the DUFunc is frozen, as the
+        # loop matching differs then (see find_ewise_function())
+        self._type_cache = {}
+        # Call-site signatures installed in the target context so far, see
+        # _install_call_site()
+        self._registered_sigs = set()
         self._install_type()
 
     def _reduce_states(self):
@@ -200,20 +418,30 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
         NOTE: part of ReduceMixin protocol
         """
         siglist = list(self._dispatcher.overloads.keys())
+        cache = not isinstance(self._dispatcher.cache, NullCache)
         return dict(
             dispatcher=self._dispatcher,
             identity=self.identity,
             frozen=self._frozen,
             siglist=siglist,
+            cache=cache,
         )
 
     @classmethod
-    def _rebuild(cls, dispatcher, identity, frozen, siglist):
+    def _rebuild(cls, dispatcher, identity, frozen, siglist, cache=False):
         """
         NOTE: part of ReduceMixin protocol
         """
         self = _internal._DUFunc.__new__(cls)
         self._initialize(dispatcher, identity)
+        if cache:
+            # The dispatcher does not carry its cache across pickling
+            try:
+                dispatcher.enable_caching()
+            except RuntimeError as e:
+                # e.g. the source file is not available in this process
+                msg = f"cannot enable caching for {dispatcher.py_func}: {e}"
+                warnings.warn(msg, errors.NumbaWarning)
         # Re-add signatures
         for sig in siglist:
             self.add(sig)
@@ -289,6 +517,24 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
         else:
             return super().__call__(*args, **kws)
 
+    def _dtype_argty(self, arg):
+        """
+        Return the Numba type of the items of *arg* if it is a NumPy array,
+        and None otherwise. This only depends on the dtype, so the result of
+        typeof() is cached to keep it out of every call. NumPy scalars are
+        left out, as they are typed differently from array items of the same
+        dtype (e.g. np.str_). So are structured dtypes: aligned and unaligned
+        ones with the same fields compare equal, but are typed as different
+        records.
+        """
+        if type(arg) is not np.ndarray or arg.dtype.fields is not None:
+            return None
+        argty = self._dtype_argtys.get(arg.dtype)
+        if argty is None:
+            argty = typeof(arg).dtype
+            self._dtype_argtys[arg.dtype] = argty
+        return argty
+
     def _compile_for_args(self, *args, **kws):
         nin = self.ufunc.nin
         if kws:
@@ -304,19 +550,22 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
         assert not kws
         argtys = []
         for arg in args[:nin]:
-            argty = typeof(arg)
-            if isinstance(argty, types.Array):
-                argty = argty.dtype
-            else:
-                # To avoid a mismatch in how Numba types scalar values as
-                # opposed to Numpy, we need special logic for scalars.
-                # For example, on 64-bit systems, numba.typeof(3) => int32, but
-                # np.array(3).dtype => int64.
-
-                # Note: this will not handle numpy "duckarrays" correctly,
-                # including but not limited to those implementing `__array__`
-                # and `__array_ufunc__`.
-                argty = numpy_support.map_arrayscalar_type(arg)
+            argty = self._dtype_argty(arg)
+            if argty is None:
+                argty = typeof(arg)
+                if isinstance(argty, types.Array):
+                    argty = argty.dtype
+                else:
+                    # To avoid a mismatch in how Numba types scalar values
+                    # as opposed to Numpy, we need special logic for
+                    # scalars. For example, on 64-bit systems,
+                    # numba.typeof(3) => int32, but
+                    # np.array(3).dtype => int64.
+
+                    # Note: this will not handle numpy "duckarrays"
+                    # correctly, including but not limited to those
+                    # implementing `__array__` and `__array_ufunc__`.
+                    argty = numpy_support.map_arrayscalar_type(arg)
             argtys.append(argty)
         return self._compile_for_argtys(tuple(argtys))
 
@@ -337,14 +586,14 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
         else:
             sig = return_type(*argtys)
 
-        for k, cres in self._dispatcher.overloads.items():
-            if argtys == k.args:
-                msg = ("Compilation requested for previously compiled argument"
-                       f" types ({argtys}). This has no effect and perhaps "
-                       "indicates a bug in the calling code (compiling a "
-                       "ufunc more than once for the same signature")
-                warnings.warn(msg, errors.NumbaWarning)
-                return cres
+        cres = self._compiled_argtys.get(argtys)
+        if cres is not None:
+            msg = ("Compilation requested for previously compiled argument"
+                   f" types ({argtys}). This has no effect and perhaps "
+                   "indicates a bug in the calling code (compiling a "
+                   "ufunc more than once for the same signature")
+            warnings.warn(msg, errors.NumbaWarning)
+            return cres
 
         cres, argtys, return_type = ufuncbuilder._compile_element_wise_function(
             self._dispatcher, self.targetoptions, sig)
@@ -354,7 +603,8 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
             cres, actual_sig)
         self._add_loop(int(ptr), dtypenums)
         self._keepalive.append((ptr, cres.library, env))
-        self._lower_me.libs.append(cres.library)
+        self._compiled_argtys[cres.signature.args] = cres
+        self._type_cache.clear()
         return cres
 
     def match_signature(self, ewise_types, sig):
@@ -490,7 +740,7 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
     def _install_ufunc_reduce(self, template) -> None:
         at = types.Function(template)
 
-        @overload_method(at, 'reduce')
+        @overload_method(at, 'reduce', prefer_literal=True)
         def ol_reduce(ufunc, array, axis=0, dtype=None, initial=None):
 
             warnings.warn("ufunc.reduce feature is experimental",
@@ -500,6 +750,12 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
                 msg = 'The first argument "array" must be array-like'
                 raise errors.NumbaTypeError(msg)
 
+            if isinstance(axis, types.Omitted):
+                # is_nonelike() holds for any omitted argument, so look at
+                # the default value instead, otherwise "axis=0" is taken
+                # for "axis=None"
+                axis = axis.value
+
             axis_int_tuple = isinstance(axis, types.UniTuple) and \
                 isinstance(axis.dtype, types.Integer)
             axis_empty_tuple = isinstance(axis, types.Tuple) and len(axis) == 0
@@ -515,141 +771,34 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
                        "reorderable, so at most one axis may be specified")
                 raise errors.NumbaTypeError(msg)
 
-            tup_init = (0,) * (array.ndim)
-            tup_init_m1 = (0,) * (array.ndim - 1)
             nb_dtype = array.dtype if cgutils.is_nonelike(dtype) else dtype
             identity = self.identity
 
             id_none = cgutils.is_nonelike(identity)
             init_none = cgutils.is_nonelike(initial)
 
-            @register_jitable
-            def tuple_slice(tup, pos):
-                # Same as
-                # tup = tup[0 : pos] + tup[pos + 1:]
-                s = tup_init_m1
-                i = 0
-                for j, e in enumerate(tup):
-                    if j == pos:
-                        continue
-                    s = tuple_setitem(s, i, e)
-                    i += 1
-                return s
-
-            @register_jitable
-            def tuple_slice_append(tup, pos, val):
-                # Same as
-                # tup = tup[0 : pos] + val + tup[pos + 1:]
-                s = tup_init
-                i, j, sz = 0, 0, len(s)
-                while j < sz:
-                    if j == pos:
-                        s = tuple_setitem(s, j, val)
-                    else:
-                        e = tup[i]
-                        s = tuple_setitem(s, j, e)
-                        i += 1
-                    j += 1
-                return s
-
-            @intrinsic
-            def compute_flat_idx(typingctx, strides, itemsize, idx, axis):
-                sig = types.intp(strides, itemsize, idx, axis)
-                len_idx = len(idx)
-
-                def gen_block(builder, block_pos, block_name, bb_end, args):
-                    strides, _, idx, _ = args
-                    bb = builder.append_basic_block(name=block_name)
-
-                    with builder.goto_block(bb):
-                        zero = ir.IntType(64)(0)
-                        flat_idx = zero
-
-                        if block_pos == 0:
-                            for i in range(1, len_idx):
-                                stride = builder.extract_value(strides, i - 1)
-                                idx_i = builder.extract_value(idx, i)
-                                m = builder.mul(stride, idx_i)
-                                flat_idx = builder.add(flat_idx, m)
-                        elif 0 < block_pos < len_idx - 1:
-                            for i in range(0, block_pos):
-                                stride = builder.extract_value(strides, i)
-                                idx_i = builder.extract_value(idx, i)
-                                m = builder.mul(stride, idx_i)
-                                flat_idx = builder.add(flat_idx, m)
-
-                            for i in range(block_pos + 1, len_idx):
-                                stride = builder.extract_value(strides, i - 1)
-                                idx_i = builder.extract_value(idx, i)
-                                m = builder.mul(stride, idx_i)
-                                flat_idx = builder.add(flat_idx, m)
-                        else:
-                            for i in range(0, len_idx - 1):
-                                stride = builder.extract_value(strides, i)
-                                idx_i = builder.extract_value(idx, i)
-                                m = builder.mul(stride, idx_i)
-                                flat_idx = builder.add(flat_idx, m)
-
-                        builder.branch(bb_end)
-
-                    return bb, flat_idx
-
-                def codegen(context, builder, sig, args):
-                    strides, itemsize, idx, axis = args
-
-                    bb = builder.basic_block
-                    switch_end = builder.append_basic_block(name='axis_end')
-                    l = []
-                    for i in range(len_idx):
-                        block, flat_idx = gen_block(builder, i, f"axis_{i}",
-                                                    switch_end, args)
-                        l.append((block, flat_idx))
-
-                    with builder.goto_block(bb):
-                        switch = builder.switch(axis, l[-1][0])
-                        for i in range(len_idx):
-                            switch.add_case(i, l[i][0])
-
-                    builder.position_at_end(switch_end)
-                    phi = builder.phi(l[0][1].type)
-                    for block, value in l:
-                        phi.add_incoming(value, block)
-                    return builder.sdiv(phi, itemsize)
-
-                return sig, codegen
-
-            @register_jitable
-            def fixup_axis(axis, ndim):
-                ax = axis
-                for i in range(len(axis)):
-                    val = axis[i] + ndim if axis[i] < 0 else axis[i]
-                    ax = tuple_setitem(ax, i, val)
-                return ax
-
-            @register_jitable
-            def find_min(tup):
-                idx, e = 0, tup[0]
-                for i in range(len(tup)):
-                    if tup[i] < e:
-                        idx, e = i, tup[i]
-                return idx, e
-
             def impl_1d(ufunc, array, axis=0, dtype=None, initial=None):
                 if identity_none and initial is None and len(array) == 0:
                     msg = ('zero-size array to reduction operation '
                            f'{ufunc_name} which has no identity')
                     raise ValueError(msg)
 
+                sz = array.shape[0]
                 start = 0
                 if init_none and id_none:
                     start = 1
                     r = array[0]
                 elif init_none:
                     r = identity
+                    if sz > 0:
+                        # Peel the first iteration: "identity" is a constant
+                        # here, so this call folds once inlined and the loop
+                        # below only ever combines array items.
+                        start = 1
+                        r = ufunc(identity, array[0])
                 else:
                     r = initial
 
-                sz = array.shape[0]
                 for i in range(start, sz):
                     r = ufunc(r, array[i])
                 return r
@@ -659,61 +808,75 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
                                  axis=0,
                                  dtype=None,
                                  initial=None):
-                if axis is None:
-                    raise ValueError("'axis' must be specified")
+                if static_axis is not None:
+                    # The axis is a compile-time constant which was already
+                    # checked and made non-negative, see below
+                    axis = static_axis
+                else:
+                    if axis is None:
+                        raise ValueError("'axis' must be specified")
 
-                if axis < 0:
-                    axis += array.ndim
+                    if axis < 0:
+                        axis += array.ndim
 
-                if axis < 0 or axis >= array.ndim:
-                    raise ValueError("Invalid axis")
+                    if axis < 0 or axis >= array.ndim:
+                        raise ValueError("Invalid axis")
 
                 if identity_none and initial is None and array.shape[axis] == 0:
                     msg = ('zero-size array to reduction operation '
                            f'{ufunc_name} which has no identity')
                     raise ValueError(msg)
 
-                # create result array
-                shape = tuple_slice(array.shape, axis)
-
-                if initial is None and identity is None:
-                    r = np.empty(shape, dtype=nb_dtype)
-                    for idx, _ in np.ndenumerate(r):
-                        # shape[0:axis] + 0 + shape[axis:]
-                        result_idx = tuple_slice_append(idx, axis, 0)
-                        r[idx] = array[result_idx]
-                elif initial is None and identity is not None:
-                    # Checking if identity is not none is redundant but required
-                    # compile this block
-                    r = np.full(shape, fill_value=identity, dtype=nb_dtype)
-                else:
-                    r = np.full(shape, fill_value=initial, dtype=nb_dtype)
-
-                # One approach to implement reduce is to remove the axis index
-                # from the indexing tuple returned by "np.ndenumerate". For
-                # instance, if idx = (X, Y, Z) and axis=1, the result index
-                # is (X, Y).
-                # Another way is to compute the result index using strides,
-                # which is faster than manipulating tuples.
-                view = r.ravel()
-                if initial is None and identity is None:
-                    for idx, val in np.ndenumerate(array):
-                        if idx[axis] == 0:
-                            continue
-                        else:
-                            flat_pos = compute_flat_idx(r.strides, r.itemsize,
-                                                        idx, axis)
-                            lhs, rhs = view[flat_pos], val
-                            view[flat_pos] = ufunc(lhs, rhs)
-                else:
-                    for idx, val in np.ndenumerate(array):
-                        if initial is None and identity is None and \
-                                idx[axis] == 0:
-                            continue
-                        flat_pos = compute_flat_idx(r.strides, r.itemsize,
-                                                    idx, axis)
-                        lhs, rhs = view[flat_pos], val
-                        view[flat_pos] = ufunc(lhs, rhs)
+                if blocked:
+                    # "array" is C-contiguous and an axis other than the last
+                    # one is reduced: view it as (outer, n * inner) where n
+                    # is the length of the reduced axis, and the result as
+                    # (outer, inner). Each block is reduced one row at a time
+                    # into a row of the result. The inner loop then walks
+                    # both rows with unit stride, rather than walking the
+                    # reduced axis with a large stride for every output
+                    # element.
+                    n = array.shape[axis]
+                    r = np.empty(_tuple_slice(array.shape, axis),
+                                 dtype=nb_dtype)
+                    a_b = _fold_c(array, axis)
+                    r_b = _fold_c(r, axis)
+                    outer, inner = r_b.shape
+                    start = 1 if initial is None and identity is None else 0
+                    for o in range(outer):
+                        block = a_b[o]
+                        out = r_b[o]
+                        for j in range(inner):
+                            out[j] = _reduce_seed(block, j, identity, initial)
+                        for i in range(start, n):
+                            base = i * inner
+                            for j in range(inner):
+                                out[j] = ufunc(out[j], block[base + j])
+                    return r
+
+                # Move the reduced axis to the end. This is only a view of
+                # "array", so no data is copied. Each output element is then
+                # the reduction of a 1D row, which is carried out in a scalar
+                # accumulator. Advancing the output index with "np.ndindex"
+                # takes additions only, instead of recomputing a flat position
+                # from the strides for every element of "array".
+                a_t = _move_axis_last(array, axis)
+
+                # create result array. It is not initialized up front: every
+                # element is seeded and reduced in a single pass below.
+                shape = a_t.shape[:-1]
+                r = np.empty(shape, dtype=nb_dtype)
+
+                start = 1 if initial is None and identity is None else 0
+                for idx in np.ndindex(shape):
+                    row = a_t[idx]
+                    r[idx] = _reduce_seed(row, 0, identity, initial)
+                    # Going through "r" casts the seed to the result dtype;
+                    # the load is forwarded from the store just above.
+                    acc = r[idx]
+                    for i in range(start, row.shape[0]):
+                        acc = ufunc(acc, row[i])
+                    r[idx] = acc
                 return r
 
             def impl_nd_axis_tuple(ufunc,
@@ -721,7 +884,7 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
                                    axis=0,
                                    dtype=None,
                                    initial=None):
-                axis_ = fixup_axis(axis, array.ndim)
+                axis_ = _fixup_axis(axis, array.ndim)
                 for i in range(0, len(axis_)):
                     if axis_[i] < 0 or axis_[i] >= array.ndim:
                         raise ValueError("Invalid axis")
@@ -730,21 +893,40 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
                         if axis_[i] == axis_[j]:
                             raise ValueError("duplicate value in 'axis'")
 
-                min_idx, min_elem = find_min(axis_)
-                r = ufunc.reduce(array,
-                                 axis=min_elem,
-                                 dtype=dtype,
-                                 initial=initial)
-                if len(axis) == 1:
-                    return r
-                elif len(axis) == 2:
-                    return ufunc.reduce(r, axis=axis_[(min_idx + 1) % 2] - 1)
-                else:
-                    ax = axis_tup
-                    for i in range(len(ax)):
-                        if i != min_idx:
-                            ax = tuple_setitem(ax, i, axis_[i])
-                    return ufunc.reduce(r, axis=ax)
+                size = 1
+                for i in range(len(axis_)):
+                    size *= array.shape[axis_[i]]
+
+                if identity_none and initial is None and size == 0:
+                    msg = ('zero-size array to reduction operation '
+                           f'{ufunc_name} which has no identity')
+                    raise ValueError(msg)
+
+                # Reduce all the axes in a single pass, as for a single axis
+                # in impl_nd_axis_int(). The reduced axes are moved to the
+                # end of a view of "array", each output element is then the
+                # reduction of a block of "a_t" walked row by row.
+                a_t = _move_axes_last(array, axis_)
+                shape = a_t.shape[:nkept]
+                rows = a_t.shape[nkept:-1]
+                r = np.empty(shape, dtype=nb_dtype)
+
+                for idx in np.ndindex(shape):
+                    block = a_t[idx]
+                    r[idx] = _reduce_seed(block, first, identity, initial)
+                    start = 1 if initial is None and identity is None else 0
+                    acc = r[idx]
+                    for jdx in np.ndindex(rows):
+                        row = block[jdx]
+                        for i in range(start, row.shape[0]):
+                            acc = ufunc(acc, row[i])
+                        start = 0
+                    r[idx] = acc
+
+                if nkept == 0:
+                    # All the axes are reduced, return a scalar
+                    return r[()]
+                return r
 
             def impl_axis_empty_tuple(ufunc,
                                       array,
@@ -772,13 +954,37 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
             elif axis_int_tuple:
                 # axis is tuple of integers
                 # ufunc(array, axis=(1, 2, ...))
-                axis_tup = (0,) * (len(axis) - 1)
+                nkept = array.ndim - len(axis)
+                first = (0,) * len(axis)
                 return impl_nd_axis_tuple
             elif axis == 0 or isinstance(axis, (types.Integer,
-                                                types.Omitted,
                                                 types.IntegerLiteral)):
                 # axis is default value (0) or an integer
                 # ufunc(array, axis=0)
+                if isinstance(axis, types.IntegerLiteral):
+                    value = axis.literal_value
+                elif isinstance(axis, int):
+                    value = axis
+                else:
+                    value = None
+
+                # When the axis is known at compile time, fold it into the
+                # kernel so that the moved-axis view and the output shape are
+                # computed with constant indices. An out of range value keeps
+                # the runtime check and its error.
+                static_axis = None
+                if value is not None:
+                    if value < 0:
+                        value += array.ndim
+                    if 0 <= value < array.ndim:
+                        static_axis = value
+                # C-contiguous arrays are reduced by blocks of whole rows,
+                # unless the last axis is reduced: the moved-axis path
+                # already walks that one with unit stride. Only one of the
+                # two paths is compiled, so this needs the axis to be known
+                # here; a runtime axis takes the moved-axis path.
+                blocked = (array.layout == 'C' and static_axis is not None
+                           and static_axis < array.ndim - 1)
                 return impl_nd_axis_int
 
     def _install_ufunc_reduceat(self, template) -> None:
@@ -813,7 +1019,6 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
 
             array_arr = isinstance(array, types.Array)
             array_ndim = array.ndim if array_arr else 0
-            tup_m1 = (0,) * (array_ndim - 1)
             indices_arr = isinstance(indices, types.Array)
             dt = array.dtype if cgutils.is_nonelike(dtype) else dtype
 
@@ -833,17 +1038,6 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
                                           out=out)
                 return impl_cast
 
-            @register_jitable
-            def tuple_slice(tup, pos):
-                s = tup_m1
-                i, j = 0, 0
-                while i < len(tup):
-                    if i != pos:
-                        s = tuple_setitem(s, j, tup[i])
-                        j += 1
-                    i += 1
-                return s
-
             # importing here as an import at the top scope brings unwanted
             # stuff. See numba/tests/test_import.py::test_no_impl_import
             from numba.np.arrayobj import generate_getitem_setitem_with_axis
@@ -889,7 +1083,7 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
                         idx = indices[i]
                         arr_slice = np.take(array, idx, axis)
                         if array_ndim > 1:
-                            _slice = tuple_slice(array.shape, axis)
+                            _slice = _tuple_slice(array.shape, axis)
                             arr_slice = arr_slice.reshape(_slice)
                         setitem(out, j, axis, arr_slice)
                     elif indices[i] >= sz or indices[i] < 0:
@@ -912,7 +1106,8 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
     def at(self, a, indices, b=None):
         # dynamic compile ufunc.at
         args = (a,) if cgutils.is_nonelike(b) else (a, b)
-        argtys = (typeof(arg) for arg in args)
+        argtys = (typeof(arg) if argty is None else argty
+                  for arg, argty in zip(args, map(self._dtype_argty, args)))
         ewise_types = tuple(arg.dtype if isinstance(arg, types.Array) else arg
                             for arg in argtys)
 
@@ -956,15 +1151,26 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
         signature was found.
         """
         if self._frozen:
-            # If we cannot compile, coerce to the best matching loop
-            loop = numpy_support.ufunc_find_matching_loop(self, ewise_types)
-            if loop is None:
+            # If we cannot compile, coerce to the best matching loop. No
+            # loop can be added anymore, so the choice is remembered.
+            ewise_types = tuple(ewise_types)
+            try:
+                loop_types = self._frozen_loops[ewise_types]
+            except KeyError:
+                loop = numpy_support.ufunc_find_matching_loop(self,
+                                                              ewise_types)
+                if loop is not None:
+                    loop_types = tuple(loop.inputs + loop.outputs)
+                else:
+                    loop_types = None
+                self._frozen_loops[ewise_types] = loop_types
+            if loop_types is None:
                 return None, None
-            ewise_types = tuple(loop.inputs + loop.outputs)[:len(ewise_types)]
-        for sig, cres in self._dispatcher.overloads.items():
-            if sig.args == ewise_types:
-                return sig, cres
-        return None, None
+            ewise_types = loop_types[:len(ewise_types)]
+        cres = self._compiled_argtys.get(tuple(ewise_types))
+        if cres is None:
+            return None, None
+        return cres.signature, cres
 
     def _type_me(self, argtys, kwtys):
         """
@@ -975,6 +1181,10 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
         element-wise signature or compiling for it.
         """
         assert not kwtys
+        key = (argtys, self._frozen)
+        cached = self._type_cache.get(key)
+        if cached is not None:
+            return cached
         ufunc = self.ufunc
         _handle_inputs_result = npydecl.Numpy_rules_ufunc._handle_inputs(
             ufunc, argtys, kwtys)
@@ -994,6 +1204,11 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
             self._compile_for_argtys(ewise_types)
             sig, cres = self.find_ewise_function(ewise_types)
             assert sig is not None
+        if cres.objectmode:
+            # Object mode loops take Python objects, which nopython code
+            # cannot hand over
+            raise errors.NumbaTypeError("cannot call %s compiled in object "
+                                        "mode with types %s" % (self, argtys))
         if explicit_output_count > 0:
             outtys = list(explicit_outputs)
         elif ufunc.nout == 1:
@@ -1004,7 +1219,30 @@ class DUFunc(serialize.ReduceMixin, _internal._DUFunc, UfuncBase):
         else:
             raise errors.NumbaNotImplementedError("typing gufuncs (nout > 1)")
         outtys.extend(argtys)
-        return signature(*outtys)
+        outer_sig = signature(*outtys)
+        self._install_call_site(explicit_output_count)
+        self._type_cache[key] = outer_sig
+        return outer_sig
+
+    def _install_call_site(self, explicit_output_count):
+        """
+        Install the implementation function for calls with the given
+        number of explicit outputs in the target context of the
+        dispatcher, the first time such a call is typed.
+
+        Unlike _install_cg(), which installs every supported call-site
+        signature up front, this only installs the ones in use.
+        """
+        # Either all outputs are explicit or none of them are
+        if explicit_output_count not in (0, self.ufunc.nout):
+            return
+        sig = ((types.Any,) * self.ufunc.nin +
+               (types.Array,) * explicit_output_count)
+        if sig in self._registered_sigs:
+            return
+        targetctx = self._dispatcher.targetdescr.target_context
+        targetctx.insert_func_defn([(self._lower_me, self, sig)])
+        self._registered_sigs.add(sig)
 
 
 array_analysis.MAP_TYPES.append(DUFunc)
@@ -38,6 +38,14 @@ def direct_dufunc_cache_usecase(**kwargs):
     return ufunc
 
 
+def direct_dufunc_sigs_cache_usecase(**kwargs):
+    @nb.vectorize(["intp(intp)", "float64(float64)"], cache=True, **kwargs)
+    def ufunc(inp):
+        return inp * 2
+
+    return ufunc
+
+
 def indirect_dufunc_cache_usecase(**kwargs):
     @nb.njit(cache=True)
     def indirect_ufunc_core(inp):
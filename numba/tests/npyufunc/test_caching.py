@@ -2,11 +2,13 @@ import sys
 import os.path
 import re
 import subprocess
+import textwrap
 
 import numpy as np
 
 from numba.tests.support import capture_cache_log
 from numba.tests.test_caching import BaseCacheTest
+from numba import njit
 from numba.core import config
 import unittest
 
@@ -126,6 +128,25 @@ class TestDUfuncCacheTest(UfuncCacheTest):
     def test_indirect_dufunc_cache(self):
         self.check_dufunc_usecase('indirect_dufunc_cache_usecase')
 
+    def test_cached_dufunc_npm_call(self):
+        # Loops loaded from the cache have no LLVM IR left, lowering a call
+        # to them must not rely on it
+        mod = self.import_module()
+        self.check_dufunc_usecase('direct_dufunc_cache_usecase')
+        ufunc = mod.direct_dufunc_cache_usecase()
+        with capture_cache_log() as out:
+            ufunc(np.arange(10))
+        self.check_cache_loaded(out.getvalue(), count=1)
+
+        @njit
+        def npm_call(inp, out):
+            ufunc(inp, out)
+
+        inp = np.arange(10)
+        out = np.zeros(10, dtype=inp.dtype)
+        npm_call(inp, out)
+        np.testing.assert_equal(out, inp * 2)
+
 
 def _fix_raw_path(rstr):
     if config.IS_WIN32:
@@ -224,5 +245,71 @@ class TestCacheSpecificIssue(UfuncCacheTest):
         self.run_in_separate_process('direct_gufunc_cache_usecase()')
 
 
+class TestPickledDUFuncCache(UfuncCacheTest):
+    """
+    A DUFunc unpickled in the same process gets back its own dispatcher,
+    so these tests unpickle in a separate one.
+    """
+
+    def run_in_separate_process(self, code):
+        setup = """
+            import pickle
+            import sys
+            import warnings
+
+            import numpy as np
+            from numba.tests.support import capture_cache_log
+
+            sys.path.insert(0, %(tempdir)r)
+            path = %(path)r
+            """ % dict(tempdir=self.tempdir,
+                       path=os.path.join(self.tempdir, 'dufunc.pkl'))
+        code = textwrap.dedent(setup) + textwrap.dedent(code)
+
+        popen = subprocess.Popen([sys.executable, "-c", code],
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = popen.communicate()
+        if popen.returncode != 0:
+            raise AssertionError("process failed with code %s: stderr follows"
+                                 "\n%s\n" % (popen.returncode, err.decode()))
+        return out.decode()
+
+    def dump_dufunc(self):
+        self.run_in_separate_process("""
+            mod = __import__(%r)
+            ufunc = mod.direct_dufunc_sigs_cache_usecase()
+            with open(path, 'wb') as f:
+                pickle.dump(ufunc, f)
+            """ % self.modname)
+
+    def test_pickled_dufunc_cache(self):
+        self.dump_dufunc()
+        # The loops are loaded from the cache when the signatures are added
+        # back to the unpickled DUFunc
+        out = self.run_in_separate_process("""
+            with capture_cache_log() as log:
+                with open(path, 'rb') as f:
+                    ufunc = pickle.load(f)
+            print(log.getvalue())
+            np.testing.assert_equal(ufunc(np.arange(10)), np.arange(10) * 2)
+            """)
+        self.check_cache_loaded(out, count=2)
+
+    def test_pickled_dufunc_cache_no_source(self):
+        self.dump_dufunc()
+        os.remove(self.modfile)
+        # Without its source file the DUFunc cannot be cached, its loops are
+        # compiled again instead
+        out = self.run_in_separate_process("""
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                with open(path, 'rb') as f:
+                    ufunc = pickle.load(f)
+            print([str(x.message) for x in w])
+            np.testing.assert_equal(ufunc(np.arange(10)), np.arange(10) * 2)
+            """)
+        self.assertIn("cannot enable caching", out)
+
+
 if __name__ == '__main__':
     unittest.main()
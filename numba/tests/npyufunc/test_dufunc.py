@@ -7,6 +7,7 @@ import warnings
 import numpy as np
 
 from numba import njit, vectorize
+from numba.core import types
 from numba.tests.support import MemoryLeakMixin, TestCase
 from numba.core.errors import (TypingError, NumbaNotImplementedError,
                                NumbaExperimentalFeatureWarning)
@@ -50,6 +51,67 @@ class TestDUFunc(MemoryLeakMixin, unittest.TestCase):
         with self.assertRaises(TypeError):
             duadd(np.linspace(0,1,10), np.linspace(1,2,10))
 
+    def test_type_cache(self):
+        duadd = self.nopython_dufunc(pyuadd)
+        duadd.add('float64(float64, float64)')
+
+        def npmadd(a0, a1):
+            return duadd(a0, a1)
+
+        X = np.arange(10, dtype=np.float32)
+        got = njit(npmadd)(X, X)
+        self.assertEqual(got.dtype, np.float32)
+        # A frozen DUFunc picks the first loop the arguments can be cast to,
+        # whatever was typed before
+        duadd.disable_compile()
+        got = njit(npmadd)(X, X)
+        self.assertEqual(got.dtype, np.float64)
+        np.testing.assert_array_equal(got, X + X)
+
+    def test_dtype_argty(self):
+        fields = [('a', np.float64), ('b', np.float64)]
+        aligned = np.zeros(2, dtype=np.dtype(fields, align=True))
+        unaligned = np.zeros(2, dtype=np.dtype(fields))
+        self.assertEqual(aligned.dtype, unaligned.dtype)
+        # Only items of arrays without fields are typed by dtype, values
+        # sharing a dtype with them but typed differently are left out
+        cases = [((aligned, unaligned), (None, None)),
+                 ((np.array(['ab']), np.str_('ab')),
+                  (types.UnicodeCharSeq(2), None)),
+                 ((np.float64(1), np.ones(2)), (None, types.float64))]
+        for args, expected in cases:
+            for order in (slice(None), slice(None, None, -1)):
+                duadd = self.nopython_dufunc(pyuadd)
+                for arg, argty in zip(args[order], expected[order]):
+                    self.assertEqual(duadd._dtype_argty(arg), argty)
+
+    def test_install_call_site(self):
+        duadd = self.nopython_dufunc(pyuadd)
+        self.assertEqual(duadd._registered_sigs, set())
+
+        @njit
+        def npmadd(a0, a1, o0):
+            duadd(a0, a1, o0)
+
+        X = np.linspace(0, 1.9, 20)
+        out = np.zeros(20)
+        npmadd(X, X, out)
+        np.testing.assert_array_equal(X + X, out)
+        # Only the signature with an explicit output is installed
+        self.assertEqual(duadd._registered_sigs,
+                         {(types.Any, types.Any, types.Array)})
+
+    def test_objmode_call(self):
+        duadd = dufunc.DUFunc(pyuadd, targetoptions=dict(forceobj=True))
+        duadd.add('float64(float64, float64)')
+
+        @njit
+        def npmadd(a0, a1):
+            return duadd(a0, a1)
+
+        with self.assertRaisesRegex(TypingError, "compiled in object mode"):
+            npmadd(np.ones(3), np.ones(3))
+
     def test_scalar(self):
         duadd = self.nopython_dufunc(pyuadd)
         self.assertEqual(pyuadd(1,2), duadd(1,2))
@@ -836,6 +898,7 @@ class TestDUFuncReduce(TestDUFuncMethodsBase):
                    "reorderable, so at most one axis may be specified")
         inputs = [
             np.arange(40, dtype=dtype).reshape(5, 4, 2),
+            np.arange(120, dtype=dtype).reshape(2, 3, 4, 5),
             np.arange(10, dtype=dtype),
         ]
         for array in inputs:
@@ -894,6 +957,44 @@ class TestDUFuncReduce(TestDUFuncMethodsBase):
         with self.assertRaisesRegex(TypingError, exc_msg):
             foo('a')
 
+    def test_dufunc_default_axis(self):
+        duadd = vectorize('int64(int64, int64)', identity=0)(pyuadd)
+
+        @njit
+        def foo(a):
+            return duadd.reduce(a)
+
+        for a in (np.arange(5), np.arange(40).reshape(5, 4, 2)):
+            expected = duadd.reduce(a)
+            got = foo(a)
+            self.assertPreciseEqual(expected, got)
+
+    def test_dufunc_literal_axis(self):
+        duadd = vectorize('int64(int64, int64)', identity=0)(pyuadd)
+
+        @njit
+        def runtime_axis(a, axis):
+            return duadd.reduce(a, axis=axis)
+
+        @njit
+        def axis_1(a):
+            return duadd.reduce(a, axis=1)
+
+        @njit
+        def axis_m1(a):
+            return duadd.reduce(a, axis=-1)
+
+        a = np.arange(40).reshape(5, 4, 2)
+        self.assertPreciseEqual(axis_1(a), duadd.reduce(a, axis=1))
+        self.assertPreciseEqual(axis_m1(a), duadd.reduce(a, axis=-1))
+        self.assertPreciseEqual(runtime_axis(a, 1), duadd.reduce(a, axis=1))
+        # A literal axis is folded into the kernel, which then has no
+        # runtime check of the axis
+        for fn, folded in ((axis_1, True), (axis_m1, True),
+                           (runtime_axis, False)):
+            llvm_ir = fn.inspect_llvm(fn.signatures[0])
+            self.assertEqual('Invalid axis' not in llvm_ir, folded)
+
     def test_dufunc_negative_axis(self):
         duadd = vectorize('int64(int64, int64)', identity=0)(pyuadd)
 
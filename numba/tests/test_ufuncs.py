@@ -1383,6 +1383,35 @@ class TestUfuncIssues(TestCase):
             check(x, np.uint64(3))
             check(x, np.int64([2, 2, 3]))
 
+    def test_zero_dim_explicit_output(self):
+        @njit
+        def foo(x, y, out):
+            np.add(x, y, out)
+            return out
+
+        got = foo(np.array(1.), np.array(2.), np.array(0.))
+        self.assertPreciseEqual(got, np.array(3.))
+
+    def test_contiguous_and_broadcast_loops(self):
+        # C contiguous arrays of the same shape are looped over as flat
+        # buffers, anything broadcast at runtime takes the strided loop
+        @njit
+        def foo(x, y, out):
+            np.add(x, y, out)
+            return out
+
+        a = np.arange(12.).reshape(3, 4)
+        cases = [(a, a + 1),
+                 (a, np.arange(4.).reshape(1, 4)),
+                 (a, np.arange(3.).reshape(3, 1)),
+                 (a, np.ones((1, 1))),
+                 (a.T.copy().T, a),
+                 (a[:, ::2], a[:, 1::2])]
+        for x, y in cases:
+            expected = np.add(x, y)
+            got = foo(x, y, np.zeros_like(expected))
+            self.assertPreciseEqual(got, expected)
+
 
 class _LoopTypesTester(TestCase):
     """Test code generation for the different loop types defined by ufunc.